@@ -0,0 +1,38 @@
+"""
+filters.py
+
+This module provides constant presets used by the dashboard filter controls.
+They are defined once at import time so Streamlit reruns reuse the same
+objects instead of rebuilding them on every widget interaction.
+"""
+
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+# Time horizon presets → arguments for rolling_window()
+HORIZON_MAPPING: Mapping[str, Mapping[str, int | str]] = MappingProxyType(
+    {
+        "1 Day": MappingProxyType({"n": 1, "unit": "days"}),  # interval = 1m
+        "5 Day": MappingProxyType({"n": 5, "unit": "days"}),
+        "1 Month": MappingProxyType({"n": 1, "unit": "months"}),
+        "6 Month": MappingProxyType({"n": 6, "unit": "months"}),
+        "1 Year": MappingProxyType({"n": 1, "unit": "years"}),
+        "3 Year": MappingProxyType({"n": 3, "unit": "years"}),
+        "5 Year": MappingProxyType({"n": 5, "unit": "years"}),
+    }
+)
+
+HORIZON_KEYS: Sequence[str] = tuple(HORIZON_MAPPING.keys())
+
+# Data interval choices (yfinance interval strings)
+INTRADAY_INTERVALS: Sequence[str] = ("1m", "2m", "5m", "15m", "30m", "1h")
+MULTIDAY_INTERVALS: Sequence[str] = (*INTRADAY_INTERVALS, "1d")
+MONTHLY_INTERVALS: Sequence[str] = ("1d", "5d", "1wk", "1mo")
+DAILY_INTERVALS: Sequence[str] = ("1d", "5d", "1wk", "1mo", "3mo")
+
+# Technical indicator presets (e.g., SMA)
+INDICATOR_MAPPING: Mapping[str, int] = MappingProxyType(
+    {"SMA 5": 5, "SMA 20": 20, "SMA 50": 50}
+)
+
+INDICATOR_KEYS: Sequence[str] = tuple(INDICATOR_MAPPING.keys())
@@ -1,10 +1,16 @@
+import plotly.io as pio
 import streamlit as st
 
+from src.models.base import Sector
 from src.ui.filters import display_filters
 from src.ui.overview import (display_charts, display_industry_overview,
                              display_sector_overview)
 from src.utils.helpers import timer
 
+# Serialise figures with orjson (C-backed, handles numpy arrays natively)
+# rather than the stdlib json encoder when sending charts to the frontend.
+pio.json.config.default_engine = "orjson"
+
 
 def configure_page() -> None:
     """Sets Streamlit page configurations."""
@@ -20,25 +26,25 @@ def display_header() -> None:
     )
 
 
-def display_sector_industry_overview() -> dict[str, str | float]:
+def display_sector_industry_overview() -> Sector:
     """
     Displays sector and industry overview sections.
 
     Returns:
-        dict[str, str | float]: sector data to be passed to filters
+        Sector: sector data to be passed to filters
     """
     sector_col, industry_col = st.columns(2, border=True)
     sector_data = display_sector_overview(sector_col)
     display_industry_overview(industry_col, sector_data.industries)
-    return sector_data.model_dump()  # this will be passed to filters
+    return sector_data  # this will be passed to filters
 
 
-def display_filter_and_charts(sector_data: dict[str, str | float]) -> None:
+def display_filter_and_charts(sector_data: Sector) -> None:
     """
     Displays filter and chart sections.
 
     Args:
-        sector_data (dict[str, str | float]): data to be passed to filters 
+        sector_data (Sector): data to be passed to filters
     """
     filter_col, chart_col = st.columns([1, 3], border=True)
     filters = display_filters(filter_col, sector_data)
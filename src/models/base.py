@@ -9,16 +9,20 @@ interfacing with APIs or other data sources.
 Notes:
     - Certain information fields from yfinance classes are not available,
     to handle this, we allow NoneTypes as value replacements.
+    - Models are frozen: they are read-only snapshots of API data, which also
+    makes scalar-only models (e.g. `Ticker`) hashable for memoization.
 """
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Ticker(BaseModel):
     """Represents an individual stock with financial attributes."""
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     display_name: str | None
     long_name: str | None
@@ -36,6 +40,8 @@ class Ticker(BaseModel):
 class Industry(BaseModel):
     """Represents an industry and its top-performing companies."""
 
+    model_config = ConfigDict(frozen=True)
+
     description: str | None
     employee_count: int | None
     market_cap: int | None
@@ -46,6 +52,8 @@ class Industry(BaseModel):
 class Sector(BaseModel):
     """Represents a market sector containing multiple industries."""
 
+    model_config = ConfigDict(frozen=True)
+
     key: str
     name: str
     overview: dict[str, Any]
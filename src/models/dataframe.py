@@ -8,10 +8,20 @@ Notes:
     - `DataFrameModel` is used instead of `SchemaModel`, which will be deprecated.
     - In this context, the terms 'model' and 'schema' are used interchangeably to
     describe data validation structures.
+    - Prices are kept as float64: float32 holds only ~7 significant digits, which
+      loses cents on high-priced tickers (e.g. BRK-A) before any computation.
+      Downcasting happens only at the plotting boundary (`to_plot_values`).
+    - `validate_once` validates a frame once at ingest; setting the
+      ``STALK_SKIP_VALIDATION`` environment variable bypasses validation (and
+      coercion) entirely for production runs.
+    - Ticker symbols repeat once per row in long-format frames, so they are
+      stored as a categorical (integer codes plus one copy of each symbol).
 """
 
+import os
 from typing import TypeAlias
 
+import pandas as pd
 from pandera.dtypes import DateTime
 from pandera.pandas import DataFrameModel, Field
 from pandera.typing import DataFrame, Series
@@ -35,7 +45,7 @@ class MultipleStockData(DataFrameModel):
     """Schema for validating multiple historical market prices and volume data."""
 
     date: Series[DateTime] = Field(alias="Date", nullable=False)
-    ticker: Series[str] = Field(alias="Ticker", nullable=False)
+    ticker: Series[pd.CategoricalDtype] = Field(alias="Ticker", nullable=False)
     close: Series[float] = Field(alias="Close")
     high: Series[float] = Field(alias="High")
     low: Series[float] = Field(alias="Low")
@@ -48,3 +58,20 @@ class MultipleStockData(DataFrameModel):
 
 
 StockDataFrame: TypeAlias = DataFrame[SingleStockData] | DataFrame[MultipleStockData]
+
+
+def validate_once(data: pd.DataFrame, model: type[DataFrameModel]) -> pd.DataFrame:
+    """
+    Validates a freshly ingested dataframe against a schema in place.
+
+    Args:
+        data (pd.DataFrame): Dataframe to validate.
+        model (type[DataFrameModel]): Schema to validate against.
+
+    Returns:
+        The validated (and coerced) dataframe, or `data` unchanged when the
+        ``STALK_SKIP_VALIDATION`` environment variable is set.
+    """
+    if os.environ.get("STALK_SKIP_VALIDATION"):
+        return data
+    return model.validate(data, lazy=True, inplace=True)
@@ -0,0 +1,193 @@
+"""
+cache.py
+
+This module provides a persistent on-disk cache for downloaded market data and
+metadata, so they survive app restarts instead of being fetched again.
+
+Notes:
+    - Frames are stored as zstd-compressed parquet files and data models as
+      JSON files, named by a blake2b hash of the request, under
+      ``$STALK_CACHE_DIR`` if set, otherwise ``$XDG_CACHE_HOME/stalkingstocks``
+      (``~/.cache/stalkingstocks``).
+    - Callers pass a TTL on every read: ranges that have fully closed are
+      reused for a day (adjusted prices change after a split or dividend),
+      ranges that reach the present only for minutes.
+    - Files older than `max_age` are pruned whenever an entry is written, so
+      the directory does not grow as the dashboard's date ranges move on.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, TypeVar
+
+import pandas as pd
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+# Seconds after which a cache file is deleted; no caller reuses older entries
+DEFAULT_MAX_AGE: int = 24 * 3600
+
+
+def default_cache_dir() -> Path:
+    """Resolve the cache directory from the environment."""
+    if directory := os.environ.get("STALK_CACHE_DIR"):
+        return Path(directory)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "stalkingstocks"
+
+
+class DiskCache:
+    """Dataframe (parquet) and data model (JSON) cache keyed by request hash."""
+
+    def __init__(
+        self, directory: Path | None = None, max_age: float = DEFAULT_MAX_AGE
+    ) -> None:
+        self.directory: Path = directory or default_cache_dir()
+        self.max_age: float = max_age
+
+    def path(self, key: Any, suffix: str = ".parquet") -> Path:
+        """
+        Map a request key to its cache file.
+
+        Args:
+            key (Any): Request parameters; must have a stable `repr`.
+            suffix (str): File extension for the stored format.
+
+        Returns:
+            The cache file path for `key`.
+        """
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self.directory / f"{digest}{suffix}"
+
+    @staticmethod
+    def is_fresh(path: Path, ttl: float | None) -> bool:
+        """Check whether a cache file exists and is younger than `ttl` seconds."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False
+        return ttl is None or time.time() - st.st_mtime <= ttl
+
+    def get(self, key: Any, ttl: float | None = None) -> pd.DataFrame | None:
+        """
+        Read a cached dataframe.
+
+        Args:
+            key (Any): Request parameters the frame was stored under.
+            ttl (float | None): Maximum age in seconds; None never expires.
+
+        Returns:
+            The cached dataframe, or None on a miss, expiry or unreadable file.
+        """
+        path = self.path(key)
+
+        if not self.is_fresh(path, ttl):
+            return None
+
+        try:
+            return pd.read_parquet(path)
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return None
+
+    def set(self, key: Any, data: pd.DataFrame) -> None:
+        """
+        Store a dataframe, replacing any previous entry atomically.
+
+        Args:
+            key (Any): Request parameters to store the frame under.
+            data (pd.DataFrame): Dataframe to cache.
+        """
+        self._write(
+            self.path(key), lambda f: data.to_parquet(f, compression="zstd")
+        )
+
+    def get_model(
+        self, key: Any, model: type[M], ttl: float | None = None
+    ) -> M | None:
+        """
+        Read a cached data model.
+
+        Args:
+            key (Any): Request parameters the model was stored under.
+            model (type[M]): Pydantic model class to parse the file into.
+            ttl (float | None): Maximum age in seconds; None never expires.
+
+        Returns:
+            The cached model, or None on a miss, expiry or unreadable file.
+        """
+        path = self.path(key, suffix=".json")
+
+        if not self.is_fresh(path, ttl):
+            return None
+
+        try:
+            return model.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError) as e:
+            logging.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return None
+
+    def set_model(self, key: Any, data: BaseModel) -> None:
+        """
+        Store a data model as JSON, replacing any previous entry atomically.
+
+        Args:
+            key (Any): Request parameters to store the model under.
+            data (BaseModel): Data model to cache.
+        """
+        self._write(
+            self.path(key, suffix=".json"),
+            lambda f: f.write(data.model_dump_json().encode()),
+        )
+
+    def _write(self, path: Path, write: Callable[[IO[bytes]], Any]) -> None:
+        """
+        Write a cache file through a private temporary file, then rename it.
+
+        Note:
+            - Each writer gets its own temporary file, so concurrent writers of
+              the same key never interleave; the last `os.replace` wins.
+
+        Args:
+            path (Path): Final cache file path.
+            write (Callable[[IO[bytes]], Any]): Writes the payload to a binary file.
+        """
+        tmp_name: str | None = None
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                write(tmp)
+            os.replace(tmp_name, path)
+        except (OSError, ValueError) as e:
+            # a cache that cannot be written is a miss next time, not an error
+            logging.warning("Could not write cache file %s: %s", path, e)
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            return
+
+        self.prune()
+
+    def prune(self) -> None:
+        """Delete cache files last written more than `max_age` seconds ago."""
+        cutoff = time.time() - self.max_age
+
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass  # removed by a concurrent prune
@@ -5,24 +5,51 @@ This module provides the core functionality of the project, including
 the main processing functions and algorithms for our application.
 
 Notes:
-    - All computation is done manually with Python.
-    - Pandas/Numpy modules are only used for input/output compatibility.
+    - Algorithms are written out explicitly rather than delegated to pandas
+      helpers (e.g. `rolling`, `pct_change`).
+    - Hot loops are expressed as NumPy array operations so the per-element work
+      runs in C instead of the Python interpreter.
+    - Pandas is only used for input/output compatibility: the SMA, streak and
+      SDR computations run in private `_..._np` kernels that take and return
+      raw arrays, wrapped by the public `compute_*` functions.
 """
 
+from typing import Iterable
+
 import numpy as np
 import pandas as pd
 
 from src.utils.helpers import timer
 
 
-@timer
-def compute_sma(close: pd.Series, window: int = 5) -> pd.Series:
+def _to_values(close: pd.Series) -> np.ndarray:
+    """
+    Returns the prices of a series as a C-contiguous float64 array.
+
+    Note:
+        - No copy is made when the series is already float64 and contiguous;
+          strided views (e.g. a column sliced out of a wider frame) and float32
+          columns are copied exactly once.
+
+    Args:
+        close (pd.Series): Closing price
+
+    Returns:
+        np.ndarray: Contiguous float64 prices for the NumPy kernels.
+    """
+    return np.ascontiguousarray(close.to_numpy(dtype=np.float64))
+
+
+def compute_sma(
+    close: pd.Series, window: int = 5, dtype: type[np.floating] = np.float64
+) -> pd.Series:
     """
     Computes the simple moving average with sliding window.
 
     Args:
         close (pd.Series): Closing price
         window (int): Window size
+        dtype (type[np.floating]): Output precision (see `compute_smas`)
 
     Returns:
         pd.Series: Computed SMA values based on input series.
@@ -32,151 +59,245 @@ def compute_sma(close: pd.Series, window: int = 5) -> pd.Series:
     # - Typical use: trend detection / denoising.
 
     # EFFICIENCY (dev note):
-    # - O(n) time: single pass with a running sum (add new, drop old).
-    # - O(n) space: output series; extra space is O(1).
-    #   Avoids recomputing sums for each window.
+    # - Single-window case of `compute_smas`; see there for the algorithm.
+    return compute_smas(close, (window,), dtype=dtype)[window]
+
 
-    # Convert pandas input to NumPy array for computation (manual algorithms)
-    values: np.ndarray = close.values
+def _compute_smas_np(
+    values: np.ndarray, windows: Iterable[int], dtype: type[np.floating] = np.float64
+) -> dict[int, np.ndarray]:
+    """
+    NumPy kernel behind `compute_smas`.
+
+    Args:
+        values (np.ndarray): Closing prices as float64
+        windows (Iterable[int]): Window sizes (e.g. 5, 20, 50)
+        dtype (type[np.floating]): Output precision
+
+    Returns:
+        dict[int, np.ndarray]: Mapping of window size to its SMA values.
+    """
+    # EFFICIENCY (dev note):
+    # - O(n) time per window: prefix sums turn every window sum into one
+    #   subtraction, sum(values[i-window+1 : i+1]) == csum[i+1] - csum[i+1-window].
+    # - O(n) space: output array plus one prefix-sum buffer.
+    # - The prefix-sum buffer is built once and shared by every window, so k
+    #   indicators cost one cumsum plus k vectorized subtractions.
+    # - Each output is allocated uninitialised and written exactly once: NaN for
+    #   the window - 1 prefix, in-place subtraction for the rest.
+    # - Prefix sums always accumulate in float64; only the (rounded) outputs use
+    #   `dtype`, so float32 output never suffers cumsum cancellation error.
     n: int = len(values)
-    out: np.ndarray = np.full(n, np.nan, dtype=float)
 
-    # Handle edge cases
-    if window <= 0 or n == 0:
-        return pd.Series(out, index=close.index)
+    # Prefix sums with a leading zero so csum[k] is the sum of the first k prices
+    csum: np.ndarray = np.empty(n + 1, dtype=np.float64)
+    csum[0] = 0.0
+    np.cumsum(values, out=csum[1:])
 
-    # Calculate SMA using sliding window approach
-    running_sum: float = 0.0
-    for i, current_price in enumerate(values):
-        # Add current price to running sum
-        running_sum += float(current_price)
+    out: dict[int, np.ndarray] = {}
+    for window in windows:
+        sma: np.ndarray = np.empty(n, dtype=dtype)
 
-        # Remove price that's now outside the window (if we have enough data)
-        if i >= window:
-            running_sum -= float(values[i - window])
+        # Handle edge cases (invalid window leaves the series undefined)
+        if window <= 0:
+            sma.fill(np.nan)
+        else:
+            # SMA is only defined once we have enough data points (window - 1 onward);
+            # only the undefined prefix is NaN-filled, the tail is written in place
+            sma[: window - 1] = np.nan
+            tail: np.ndarray = sma[window - 1 :]
+            np.subtract(csum[window:], csum[:-window], out=tail)
+            tail /= window
 
-        # Calculate SMA only when we have enough data points
-        if i >= window - 1:
-            out[i] = running_sum / window
+        out[window] = sma
 
-    # Convert Python result back to pandas Series for output
-    return pd.Series(out, index=close.index)
+    return out
 
 
 @timer
-def compute_streak(close: pd.Series) -> tuple[int, int, pd.Series]:
+def compute_smas(
+    close: pd.Series, windows: Iterable[int], dtype: type[np.floating] = np.float64
+) -> dict[int, pd.Series]:
     """
-    Computes the longest up, down streaks, and a daily direction mask.
+    Computes simple moving averages for several window sizes at once.
+
+    Note:
+        - `dtype=np.float32` halves the output size; its ~7 significant digits
+          are ample for display, but keep float64 for further arithmetic.
 
     Args:
         close (pd.Series): Closing price
+        windows (Iterable[int]): Window sizes (e.g. 5, 20, 50)
+        dtype (type[np.floating]): Output precision
 
     Returns:
-        tuple[int, int, pd.Series]: Longest up streak, downstreak, and mask.
+        dict[int, pd.Series]: Mapping of window size to its SMA values.
+    """
+    # Convert pandas input to NumPy array for computation
+    values: np.ndarray = _to_values(close)
+
+    # Convert results back to pandas Series for output (no data copy)
+    return {
+        window: pd.Series(sma, index=close.index, copy=False)
+        for window, sma in _compute_smas_np(values, windows, dtype=dtype).items()
+    }
+
+
+def _compute_streak_np(values: np.ndarray) -> tuple[int, int, np.ndarray]:
+    """
+    NumPy kernel behind `compute_streak`.
+
+    Args:
+        values (np.ndarray): Closing prices as float64
+
+    Returns:
+        tuple[int, int, np.ndarray]: Longest up streak, downstreak, and mask.
     """
     # RATIONALE (dev note):
     # - Up: Close_t > Close_{t-1}; Down: < ; Flat: == (breaks streaks).
     # - Useful for momentum diagnostics and run-length visualization.
 
     # EFFICIENCY (dev note):
-    # - O(n) time; O(1) auxiliary state (mask is intended output).
-    # - Single pass, minimal counters.
+    # - O(n) time; O(n) auxiliary arrays (mask is intended output).
+    # - Run-length encoding over the direction array: a streak is a run of
+    #   equal, non-zero directions, so its length is the gap between two
+    #   consecutive run starts. All passes are vectorized NumPy operations.
 
-    # Convert pandas input to NumPy array for computation (manual algorithms)
-    values: np.ndarray = close.values
     n: int = len(values)
 
     # Handle edge case: need at least 2 prices to determine direction
     if n <= 1:
-        return (0, 0, pd.Series(np.zeros(n, dtype=int), index=close.index))
-
-    # Initialize counters and mask
-    longest_up_streak: int = 0
-    longest_down_streak: int = 0
-    current_streak: int = 0
-    current_direction: int = 0  # 0 = no direction, 1 = up, -1 = down
-    mask: np.ndarray = np.zeros(n, dtype=int)
-
-    # Single pass through all prices
-    for i in range(1, n):
-        previous_price: float = values[i - 1]
-        current_price: float = values[i]
-
-        # Determine movement direction
-        if current_price > previous_price:
-            new_direction: int = 1  # Upward movement
-        elif current_price < previous_price:
-            new_direction: int = -1  # Downward movement
-        else:
-            new_direction: int = 0  # Flat day
+        return (0, 0, np.zeros(n, dtype=np.int8))
 
-        # Record daily trend in mask for plotting
-        mask[i] = new_direction
+    # Daily direction: 1 = up, -1 = down, 0 = flat (NaN compares as flat);
+    # boolean masks are reinterpreted as int8 in place (no copy, 1 byte/day)
+    changes: np.ndarray = np.diff(values)
+    directions: np.ndarray = (changes > 0).view(np.int8) - (changes < 0).view(np.int8)
 
-        # Update streaks efficiently
-        if new_direction == current_direction and new_direction != 0:
-            current_streak += 1
-        else:
-            # Direction change — update longest streaks before reset
-            if current_direction == 1 and current_streak > longest_up_streak:
-                longest_up_streak = current_streak
-            elif current_direction == -1 and current_streak > longest_down_streak:
-                longest_down_streak = current_streak
-
-            # Reset for next streak
-            current_direction = new_direction
-            current_streak = 1 if new_direction != 0 else 0
-
-    # Final streak check (include last run)
-    if current_direction == 1 and current_streak > longest_up_streak:
-        longest_up_streak = current_streak
-    elif current_direction == -1 and current_streak > longest_down_streak:
-        longest_down_streak = current_streak
+    # Record daily trend in mask for plotting (first day has no direction)
+    mask: np.ndarray = np.zeros(n, dtype=np.int8)
+    mask[1:] = directions
+
+    # Locate the start of each run and derive run lengths from the gaps
+    run_starts: np.ndarray = np.flatnonzero(
+        np.concatenate(([True], directions[1:] != directions[:-1]))
+    )
+    run_lengths: np.ndarray = np.diff(np.append(run_starts, directions.size))
+    run_directions: np.ndarray = directions[run_starts]
+
+    # Flat runs never count as streaks
+    longest_up_streak: int = int(run_lengths[run_directions == 1].max(initial=0))
+    longest_down_streak: int = int(run_lengths[run_directions == -1].max(initial=0))
+
+    return (longest_up_streak, longest_down_streak, mask)
+
+
+@timer
+def compute_streak(close: pd.Series) -> tuple[int, int, pd.Series]:
+    """
+    Computes the longest up, down streaks, and a daily direction mask.
+
+    Args:
+        close (pd.Series): Closing price
+
+    Returns:
+        tuple[int, int, pd.Series]: Longest up streak, downstreak, and mask.
+    """
+    # Convert pandas input to NumPy array for computation
+    values: np.ndarray = _to_values(close)
+    longest_up_streak, longest_down_streak, mask = _compute_streak_np(values)
 
     # Return results with mask as Series
     return (longest_up_streak, longest_down_streak, pd.Series(mask, index=close.index))
 
 
+def _compute_sdr_np(
+    values: np.ndarray, dtype: type[np.floating] = np.float64
+) -> np.ndarray:
+    """
+    NumPy kernel behind `compute_sdr`.
+
+    Args:
+        values (np.ndarray): Closing prices as float64
+        dtype (type[np.floating]): Output precision
+
+    Returns:
+        np.ndarray: Fractional daily returns; the first value is NaN.
+    """
+    # RATIONALE (dev note):
+    # - Normalizes moves for comparability; basis for volatility/risk metrics.
+
+    # EFFICIENCY (dev note):
+    # - O(n) time; O(n) output.
+    # - One vectorized subtract and divide over the whole array; zero
+    #   previous prices are masked out instead of branched on per element.
+
+    n: int = len(values)
+    # First day has no return
+    daily_returns: np.ndarray = np.full(n, np.nan, dtype=dtype)
+
+    if n <= 1:
+        return daily_returns
+
+    # Daily return = (current_price - previous_price) / previous_price
+    previous_prices: np.ndarray = values[:-1]
+    np.divide(
+        np.diff(values),
+        previous_prices,
+        out=daily_returns[1:],
+        where=previous_prices != 0,  # Avoid division by zero (left as NaN)
+    )
+
+    return daily_returns
+
+
 @timer
-def compute_sdr(close: pd.Series) -> pd.Series:
+def compute_sdr(close: pd.Series, dtype: type[np.floating] = np.float64) -> pd.Series:
     """
     Compute simple daily returns (fractional change from the previous close).
 
+    Note:
+        - Returns are computed in float64 and only rounded to `dtype` on
+          output; `np.float32` halves the result size at ~7 significant digits.
+
     Args:
         close (pd.Series): Series of closing prices.
+        dtype (type[np.floating]): Output precision.
 
     Returns:
         pd.Series: Fractional daily returns computed as close.pct_change()
             (r_t = close_t / close_{t-1} - 1); preserves the input index;
             the first value is NaN.
     """
-    # RATIONALE (dev note):
-    # - Normalizes moves for comparability; basis for volatility/risk metrics.
+    # Convert pandas input to NumPy array for computation
+    values: np.ndarray = _to_values(close)
 
-    # EFFICIENCY (dev note):
-    # - O(n) time; O(n) output. Constant extra vars.
+    # Convert result back to pandas Series for output (no data copy)
+    daily_returns: np.ndarray = _compute_sdr_np(values, dtype=dtype)
+    return pd.Series(daily_returns, index=close.index, copy=False)
 
-    # Convert pandas input to NumPy array for computation (manual algorithms)
-    values: np.ndarray = close.values
-    n: int = len(values)
-    daily_returns: list[float | None] = [
-        None
-    ]  # First day has no return (no previous day)
-
-    # Calculate daily returns using pure Python
-    for i in range(1, n):
-        previous_price: float = values[i - 1]
-        current_price: float = values[i]
-
-        if previous_price != 0:  # Avoid division by zero
-            # Daily return = (current_price - previous_price) / previous_price
-            daily_return: float = (current_price - previous_price) / previous_price
-            daily_returns.append(daily_return)
-        else:
-            daily_returns.append(None)  # Handle zero price case
 
-    # Convert Python result back to pandas Series for output
-    return pd.Series(daily_returns, index=close.index)
+def compute_last_sdr(close: pd.Series) -> float:
+    """
+    Compute the most recent simple daily return only.
+
+    Note:
+        - Fast path for callers that only need the latest return; avoids
+          materialising the full series produced by `compute_sdr`.
+
+    Args:
+        close (pd.Series): Series of closing prices.
+
+    Returns:
+        float: Latest fractional return (NaN if unavailable).
+    """
+    values: np.ndarray = _to_values(close)
+
+    # Need two prices, and a non-zero previous price, to define a return
+    if len(values) < 2 or values[-2] == 0:
+        return float("nan")
+
+    return float((values[-1] - values[-2]) / values[-2])
 
 
 @timer
@@ -195,23 +316,86 @@ def compute_max_profit(close: pd.Series) -> float:
     # - Equivalent to summing max(0, P_{t+1} - P_t).
 
     # EFFICIENCY (dev note):
-    # - O(n) time; O(1) extra space.
+    # - O(n) time; O(n) extra space for the day-to-day differences.
     # - Greedy is optimal here; no backtracking/lookahead required.
+    # - One vectorized diff, one in-place clip, and one reduction replace the
+    #   Python loop.
 
-    # Convert pandas input to NumPy array for computation (manual algorithms)
-    values: np.ndarray = close.values
-    n: int = len(values)
-    total_profit: float = 0.0
+    # Convert pandas input to NumPy array for computation
+    values: np.ndarray = _to_values(close)
 
-    # Calculate max profit by summing all positive price increases
     # Strategy: Buy before every price increase, sell after it
-    for i in range(n - 1):
-        current_price: float = values[i]
-        next_price: float = values[i + 1]
-
-        if next_price > current_price:
-            # If next day's price is higher, we can profit by buying today and selling tomorrow
-            profit_from_transaction: float = next_price - current_price
-            total_profit += profit_from_transaction
+    # `fmax` clips falls to zero in place of a boolean-mask copy, and maps NaN
+    # differences to zero so gaps never add profit
+    changes: np.ndarray = np.diff(values)
+    total_profit: float = np.fmax(changes, 0.0, out=changes).sum()
 
     return float(total_profit)
+
+
+@timer
+def downsample_lttb(close: pd.Series, threshold: int = 2000) -> pd.Series:
+    """
+    Downsamples a price series with Largest-Triangle-Three-Buckets (LTTB).
+
+    Note:
+        - Points are spaced by position, so gaps in the index (e.g. overnight
+          for intraday data) are treated as a single step.
+        - Series already at or below `threshold` points are returned as-is.
+        - Not applied to the dashboard's price chart: its longest series
+          (5 days at 1m, ~1950 points) draws fine in full, and thinning it
+          would drop real bars from hover and misalign them with the overlays.
+          It is meant for much longer series (tens of thousands of points).
+
+    Args:
+        close (pd.Series): Closing price
+        threshold (int): Maximum number of points to keep
+
+    Returns:
+        pd.Series: Subset of the input that preserves its visual shape.
+    """
+    # RATIONALE (dev note):
+    # - Browsers struggle once a trace carries tens of thousands of points.
+    # - LTTB keeps the first/last points and, per bucket, the point forming the
+    #   largest triangle with its neighbours, so peaks and troughs survive
+    #   (unlike taking every n-th point).
+
+    # EFFICIENCY (dev note):
+    # - O(n) time: every point is visited once across all buckets.
+    # - Python loop runs once per bucket (<= threshold); the work inside each
+    #   bucket is vectorized.
+    n: int = len(close)
+    if threshold < 3 or n <= threshold:
+        return close
+
+    values: np.ndarray = _to_values(close)
+    positions: np.ndarray = np.arange(n, dtype=np.float64)
+
+    # Interior points are split into (threshold - 2) buckets
+    bucket_size: float = (n - 2) / (threshold - 2)
+    selected: np.ndarray = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor: int = 0
+
+    for i in range(threshold - 2):
+        # Current bucket candidates
+        start: int = int(i * bucket_size) + 1
+        end: int = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket acts as the third triangle vertex
+        next_start: int = end
+        next_end: int = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x: float = positions[next_start:next_end].mean()
+        avg_y: float = values[next_start:next_end].mean()
+
+        # Twice the triangle area for each candidate (constant factor dropped)
+        areas: np.ndarray = np.abs(
+            (positions[anchor] - avg_x) * (values[start:end] - values[anchor])
+            - (positions[anchor] - positions[start:end]) * (avg_y - values[anchor])
+        )
+
+        anchor = start + int(np.argmax(areas))
+        selected[i + 1] = anchor
+
+    return close.iloc[selected]
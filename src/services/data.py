@@ -2,42 +2,63 @@
 data.py
 
 This module provides data processing functionality before computing domain metrics.
+
+Notes:
+    - Every function accepts a series or a whole dataframe, so several columns
+      sharing one index are cleaned in a single vectorized pass.
 """
 
+from typing import TypeVar
+
+import numpy as np
 import pandas as pd
 
 from src.utils.helpers import timer
 
+# A series or dataframe; functions return the same type they are given
+SeriesOrFrame = TypeVar("SeriesOrFrame", pd.Series, pd.DataFrame)
+
 
-def has_missing(series: pd.Series) -> bool:
+def has_missing(series: SeriesOrFrame) -> bool:
     """
     Check if a time series contains any missing values (NaNs).
 
     Args:
-        series (pd.Series): Series to check.
+        series (SeriesOrFrame): Series (or dataframe) to check.
 
     Returns:
         bool: True if series contains missing values, False otherwise.
     """
-    return pd.isna(series).any()
+    # EFFICIENCY (dev note):
+    # - Dataframes are checked column by column, stopping at the first column
+    #   with a gap, so no full boolean frame is ever materialised.
+    # - Float columns are checked with `np.isnan` directly on the underlying
+    #   array; other dtypes fall back to `pd.isna`.
+    if isinstance(series, pd.DataFrame):
+        return any(has_missing(column) for _, column in series.items())
+
+    values = series.to_numpy()
+    if values.dtype.kind == "f":
+        return bool(np.isnan(values).any())
+    return bool(pd.isna(values).any())
 
 
 @timer
-def fill_gaps(series: pd.Series) -> pd.Series:
+def fill_gaps(series: SeriesOrFrame) -> SeriesOrFrame:
     """
     Fill missing values in a time series using forward and backward-fill.
 
     Args:
-        series (pd.Series): Series to impute.
+        series (SeriesOrFrame): Series (or dataframe, filled column-wise) to impute.
 
     Returns:
-        pd.Series: Series with imputed values.
+        SeriesOrFrame: Series with imputed values.
     """
     return series.ffill().bfill()
 
 
 @timer
-def remove_non_trading_days(series: pd.Series) -> pd.Series:
+def remove_non_trading_days(series: SeriesOrFrame) -> SeriesOrFrame:
     """
     Remove weekend rows (keep Monday–Friday) from a daily series.
 
@@ -47,10 +68,10 @@ def remove_non_trading_days(series: pd.Series) -> pd.Series:
           for weekends.
 
     Args:
-        series (pd.Series): Series to process.
+        series (SeriesOrFrame): Series (or dataframe) to process.
 
     Returns:
-        pd.Series: Series with non-trading days removed.
+        SeriesOrFrame: Series with non-trading days removed.
     """
     # RATIONALE (dev note):
     # - Upstream joins/exports may introduce weekends; indicators should operate
@@ -58,25 +79,27 @@ def remove_non_trading_days(series: pd.Series) -> pd.Series:
 
     # EFFICIENCY (dev note):
     # - O(n) boolean mask; vectorized.
+    # - The input is only copied by the final selection (and re-labelled
+    #   without copying data when its index needs converting).
 
     # NOTES (dev note):
     # - Converts index to DatetimeIndex if needed.
     # - Does not handle exchange holidays explicitly (usually absent in Yahoo data).
-    s = series.copy()
-    if not isinstance(s.index, pd.DatetimeIndex):
-        s.index = pd.to_datetime(s.index)
-    return s[s.index.dayofweek < 5]  # 0=Mon ... 4=Fri
+    if not isinstance(series.index, pd.DatetimeIndex):
+        series = series.copy(deep=False)  # shares data; only the index is replaced
+        series.index = pd.to_datetime(series.index)
+    return series.loc[series.index.dayofweek < 5]  # 0=Mon ... 4=Fri
 
 
-def clean_data(series: pd.Series) -> pd.Series:
+def clean_data(series: SeriesOrFrame) -> SeriesOrFrame:
     """
     Cleans a series.
 
     Args:
-        series (pd.Series): Series to be cleaned.
+        series (SeriesOrFrame): Series (or dataframe) to be cleaned.
 
     Returns:
-        pd.Series: Cleaned series.
+        SeriesOrFrame: Cleaned series.
     """
 
     # if missing values exist, we fill those gaps before removing weekends.
@@ -113,13 +136,13 @@ def clean_outliers_iqr(
 
     # EFFICIENCY (dev note):
     # - O(n): percentile estimation + vectorized mask.
+    # - Both quartiles come from a single quantile call (one partition pass).
     # - Returns new Series; no Python loops.
 
     # EDGE CASES (dev note):
     # - Constant series → IQR=0 → Lower==Upper → no flags.
     # - Heavy-tailed distributions may flag more points; tune `k`.
-    q1 = series.quantile(0.25)
-    q3 = series.quantile(0.75)
+    q1, q3 = series.quantile([0.25, 0.75]).to_numpy()
     iqr = q3 - q1
     lower = q1 - k * iqr
     upper = q3 + k * iqr
@@ -5,27 +5,63 @@ This module fetches and models financial data from yfinance, including sector/in
 metadata, ticker details, and validated OHLCV downloads. 
 
 It provides a thin, typed interface that abstracts raw API calls into reusable functions.
+
+Notes:
+    - Remote calls are memoized with `@st.cache_data` so Streamlit reruns (every
+      widget interaction) are served from memory instead of re-hitting yfinance.
+    - Sector and industry metadata rarely changes intraday and is kept for an
+      hour; price history and ticker details (which carry the live price) use a
+      shorter TTL to stay reasonably fresh.
+    - Downloads and sector/industry metadata are also persisted to disk (see
+      `src.services.cache`) so an app restart does not re-fetch closed
+      historical ranges or metadata younger than their TTLs.
+    - Cache TTLs add up across layers: each layer's TTL restarts when it is
+      refilled from the layer below, which may itself be almost a TTL old. Sector
+      and industry metadata (memory, then disk) can therefore be up to two hours
+      old.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterable, Sequence, TypeAlias
 
 import pandas as pd
+import streamlit as st
 import yfinance as yf
+from streamlit.runtime.scriptrunner import (add_script_run_ctx,
+                                            get_script_run_ctx)
 
 from src.constants.sectors import SECTORS
 from src.models.base import Industry, Sector, Ticker
 from src.models.dataframe import (MultipleStockData, SingleStockData,
-                                  StockDataFrame)
-from src.utils.helpers import timer
+                                  StockDataFrame, validate_once)
+from src.services.cache import DiskCache
+from src.utils.helpers import rolling_window, timer
 from src.utils.parsers import (yf_industry_to_model, yf_sector_to_model,
                                yf_ticker_to_model)
 
+# Years of daily history kept per ticker (covers the longest dashboard horizon)
+DAILY_HISTORY_YEARS: int = 6
+
+# Seconds price data that reaches the present is reused from memory and disk
+OPEN_RANGE_TTL: int = 300
+
+# Seconds a fully closed range is reused from disk; bounded because adjusted
+# (auto_adjust=True) prices are rewritten after a split or dividend
+CLOSED_RANGE_TTL: int = 24 * 3600
+
+# Seconds sector and industry metadata is reused from memory and disk
+METADATA_TTL: int = 3600
+
+disk_cache: DiskCache = DiskCache()
+
 
 def get_sectors() -> Sequence[str]:
     """Returns a read-only iterable of sector names."""
     return SECTORS
 
 
+@st.cache_data(ttl=METADATA_TTL, show_spinner=False)
 @timer
 def get_sector_info(sector_key: str) -> Sector:
     """
@@ -37,14 +73,22 @@ def get_sector_info(sector_key: str) -> Sector:
     Returns:
         A Sector data model containing sector information.
     """
+    key = ("sector", sector_key)
+    if (cached := disk_cache.get_model(key, Sector, ttl=METADATA_TTL)) is not None:
+        return cached
+
     try:
         yf_sector = yf.Sector(key=sector_key)
     except Exception as e:
         raise RuntimeError(f"Failed to retrieve data for {sector_key}: {e}")
 
-    return yf_sector_to_model(yf_sector)
+    data: Sector = yf_sector_to_model(yf_sector)
+    disk_cache.set_model(key, data)
+
+    return data
 
 
+@st.cache_data(ttl=METADATA_TTL, show_spinner=False)
 @timer
 def get_industry_info(industry_key: str) -> Industry:
     """
@@ -60,12 +104,17 @@ def get_industry_info(industry_key: str) -> Industry:
     Returns:
         A Sector data model containing sector information.
     """
+    key = ("industry", industry_key)
+    if (cached := disk_cache.get_model(key, Industry, ttl=METADATA_TTL)) is not None:
+        return cached
+
     try:
         yf_industry = yf.Industry(key=industry_key)
     except Exception as e:
         raise RuntimeError(f"Failed to retrieve data for {industry_key}: {e}")
 
     data: Industry = yf_industry_to_model(yf_industry)
+    disk_cache.set_model(key, data)
 
     return data
 
@@ -73,13 +122,62 @@ def get_industry_info(industry_key: str) -> Industry:
 IndustryOverview: TypeAlias = Iterable[dict[str, str | float]]
 
 
+def try_get_industry_info(industry_key: str) -> Industry | None:
+    """
+    Retrieves metadata on a single industry, tolerating failures.
+
+    Args:
+        industry_key (str): Industry key to be queried
+
+    Returns:
+        An Industry data model, or None if the lookup failed (e.g. rate limited).
+    """
+    try:
+        return get_industry_info(industry_key)
+    except Exception as e:
+        logging.warning("Skipping industry %s: %s", industry_key, e)
+        return None
+
+
 def get_industry_overview(
     industries: Iterable[str],
 ) -> IndustryOverview:
+    """
+    Retrieves market weight and daily change for each industry in a sector.
+
+    Note:
+        - Each industry is a separate yfinance round-trip, so lookups are
+          issued concurrently; threads suffice since the work is network-bound.
+        - Pool threads are attached to the calling script's run context, so the
+          `@st.cache_data` lookups in `get_industry_info` run as they would on
+          the script thread instead of without a `ScriptRunContext`.
+        - Industries whose lookup fails are left out rather than failing the
+          whole overview.
+
+    Args:
+        industries (Iterable[str]): Industry keys to be queried
+
+    Returns:
+        A list of records containing industry key, weight, and percentage change.
+    """
+    industries = list(industries)
     data: IndustryOverview = []
 
-    for ind in industries:
-        info: Industry = get_industry_info(ind)
+    if not industries:
+        return data
+
+    with ThreadPoolExecutor(
+        max_workers=min(16, len(industries)),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as executor:
+        infos: list[Industry | None] = list(
+            executor.map(try_get_industry_info, industries)
+        )
+
+    for ind, info in zip(industries, infos):
+        if info is None:
+            continue
         data.append(
             {
                 "industry": ind,
@@ -91,6 +189,7 @@ def get_industry_overview(
     return data
 
 
+@st.cache_data(ttl=OPEN_RANGE_TTL, show_spinner=False)
 @timer
 def get_ticker_info(ticker_symbol: str, **kwargs: Any) -> Ticker:
     """
@@ -104,13 +203,16 @@ def get_ticker_info(ticker_symbol: str, **kwargs: Any) -> Ticker:
     Returns:
         Ticker Data Model
     """
-
+    # Not persisted to disk: `Ticker.price` is the live price behind the price
+    # metrics, and must stay as fresh as the closes charted next to it
     try:
         yf_ticker = yf.Ticker(ticker=ticker_symbol, **kwargs)
     except Exception as e:
         raise RuntimeError(f"Failed to retrieve info for {ticker_symbol}: {e}")
 
-    return yf_ticker_to_model(yf_ticker)
+    data: Ticker = yf_ticker_to_model(yf_ticker)
+
+    return data
 
 
 def get_ticker_data(
@@ -120,6 +222,13 @@ def get_ticker_data(
     Retrieve historical market data for one or multiple ticker symbols using
     Yahoo Finance.
 
+    Note:
+        - Daily (`interval="1d"`) requests for a single ticker are sliced out of
+          a shared multi-year history (see `get_daily_history`), so switching
+          between horizons does not trigger another download.
+        - Not cached itself: the history and direct downloads are memoised
+          below, and another layer on top would add its TTL to theirs.
+
     Args:
         ticker_symbols (str | list[str]):
             A single ticker symbol or list of ticker symbols (e.g., ["AAPL", "MSFT", "GOOG"]).
@@ -131,20 +240,194 @@ def get_ticker_data(
         A validated dataframe of OHLCV (open, high, low, close, volume) data
         from yfinance.
     """
+    if (
+        isinstance(ticker_symbols, str)
+        and kwargs.get("interval") == "1d"
+        and "start" in kwargs
+    ):
+        options: dict[str, Any] = dict(kwargs)
+        start = pd.Timestamp(options.pop("start"))
+        end = options.pop("end", None)
+        options.pop("interval")
+
+        # the history holds everything yfinance has from its own start onward,
+        # including tickers listed after it, so compare against that start
+        history_start, _ = rolling_window(DAILY_HISTORY_YEARS, unit="years")
+        if start >= pd.Timestamp(history_start):
+            history: StockDataFrame | None = get_daily_history(
+                ticker_symbols, **options
+            )
+            if history is not None:
+                return slice_date_range(history, start, end)
+
+    return get_ticker_download(ticker_symbols, **kwargs)
+
+
+@st.cache_data(ttl=OPEN_RANGE_TTL, show_spinner=False)
+def get_ticker_download(
+    ticker_symbols: str | list[str], **kwargs: Any
+) -> StockDataFrame | None:
+    """
+    Memoised `download_ticker_data` for requests not served from the history.
+
+    Args:
+        ticker_symbols (str | list[str]):
+            A single ticker symbol or list of ticker symbols (e.g., ["AAPL", "MSFT", "GOOG"]).
+        **kwargs (Any):
+            Additional keyword arguments passed to `yfinance.download`,
+            such as `start`, `end`, `interval`, etc.
+
+    Returns:
+        A validated dataframe of OHLCV data, or None if unavailable.
+    """
+    return download_ticker_data(ticker_symbols, **kwargs)
+
+
+@st.cache_data(ttl=OPEN_RANGE_TTL, show_spinner=False)
+def get_daily_history(ticker_symbol: str, **kwargs: Any) -> StockDataFrame | None:
+    """
+    Retrieve several years of daily market data for a single ticker.
+
+    Note:
+        - Covers every horizon offered by the dashboard, so shorter daily
+          horizons can be sliced from it instead of being downloaded again.
+        - Fetched as two ranges split at today's date (New York time): the
+          closed years are served from the disk cache for `CLOSED_RANGE_TTL`,
+          so only the current session's bar is downloaded on each refresh.
+
+    Args:
+        ticker_symbol (str): The ticker symbol of the stock or asset (e.g., "AAPL").
+        **kwargs (Any):
+            Additional keyword arguments passed to `yfinance.download`,
+            such as `progress`, `auto_adjust`, etc.
+
+    Returns:
+        A validated dataframe of daily OHLCV data, or None if unavailable.
+    """
+    start, _ = rolling_window(DAILY_HISTORY_YEARS, unit="years")
+    today = pd.Timestamp.now(tz="America/New_York").date()
+
+    closed: StockDataFrame | None = download_ticker_data(
+        ticker_symbol, interval="1d", start=start, end=today, **kwargs
+    )
+    # empty before the open and on non-trading days
+    latest: StockDataFrame | None = download_ticker_data(
+        ticker_symbol, interval="1d", start=today, **kwargs
+    )
+
+    if closed is None or latest is None:
+        return closed if latest is None else latest
+
+    return pd.concat([closed, latest])
+
+
+def slice_date_range(
+    data: StockDataFrame, start: pd.Timestamp, end: Any | None = None
+) -> StockDataFrame | None:
+    """
+    Select rows within [start, end) from a date-indexed dataframe.
+
+    Note:
+        - `end` is exclusive to match `yfinance.download`.
+
+    Args:
+        data (StockDataFrame): Date-indexed market data.
+        start (pd.Timestamp): First date to include.
+        end (Any | None): Date to stop before; None keeps everything after `start`.
+
+    Returns:
+        The selected rows, or None if no rows fall within the range.
+    """
+    tz = data.index.tz
+    mask = data.index >= pd.Timestamp(start).tz_localize(tz)
+
+    if end is not None:
+        mask &= data.index < pd.Timestamp(end).tz_localize(tz)
+
+    sliced = data.loc[mask]
+    return None if sliced.empty else sliced
+
+
+def download_ticker_data(
+    ticker_symbols: str | list[str], **kwargs: Any
+) -> StockDataFrame | None:
+    """
+    Download and validate historical market data from Yahoo Finance.
+
+    Note:
+        - Results, including empty ones, are kept in the disk cache for
+          `OPEN_RANGE_TTL`, or `CLOSED_RANGE_TTL` once the range has closed.
+
+    Args:
+        ticker_symbols (str | list[str]):
+            A single ticker symbol or list of ticker symbols (e.g., ["AAPL", "MSFT", "GOOG"]).
+        **kwargs (Any):
+            Additional keyword arguments passed to `yfinance.download`,
+            such as `start`, `end`, `interval`, etc.
+
+    Returns:
+        A validated dataframe of OHLCV (open, high, low, close, volume) data
+        from yfinance, or None if no rows were returned.
+    """
+    key = ("download", ticker_symbols, sorted(kwargs.items()))
+    ttl = CLOSED_RANGE_TTL if is_closed_range(kwargs.get("end")) else OPEN_RANGE_TTL
+
+    if (cached := disk_cache.get(key, ttl=ttl)) is not None:
+        return None if cached.empty else cached
+
     data: pd.DataFrame = yf.download(tickers=ticker_symbols, **kwargs)
 
     if data.empty:
+        # remember the miss (e.g. today's bar before the open, or on a day the
+        # market is shut) so reruns within the TTL do not download it again
+        disk_cache.set(key, pd.DataFrame())
         return None
 
     # Handle single vs multi-ticker cases:
     if isinstance(ticker_symbols, str):
-        data.columns = data.columns.droplevel(1)
+        # Flatten (Price, Ticker) columns; `get_level_values` reuses the level's
+        # labels instead of rebuilding a MultiIndex as `droplevel` does
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
         # Remove non-trading days (where data is missing)
         data = data.dropna(subset=["Open", "Close"])  # or just ["Volume"]
-        data: StockDataFrame = SingleStockData.validate(data)
+        data: StockDataFrame = validate_once(data, SingleStockData)
     else:
-        # Collapse it into flat columns for validation
-        data = data.stack(level=-1).reset_index().rename(columns={"level_1": "Ticker"})
-        data: StockDataFrame = MultipleStockData.validate(data)
+        # Collapse it into flat columns for validation; naming the index levels
+        # explicitly avoids relying on positional names such as "level_1"
+        data = (
+            data.stack(level="Ticker", future_stack=True)
+            .rename_axis(["Date", "Ticker"])
+            .reset_index()
+            .dropna(subset=["Open", "Close"])  # tickers not trading that day
+        )
+        data["Ticker"] = data["Ticker"].astype("category")
+        data: StockDataFrame = validate_once(data, MultipleStockData)
 
+    disk_cache.set(key, data)
     return data
+
+
+def is_closed_range(end: Any | None) -> bool:
+    """
+    Check whether a download range ends before the current trading day.
+
+    Note:
+        - `end` is exclusive, so a range ending at today's date (New York time)
+          only holds bars from sessions that have already closed.
+
+    Args:
+        end (Any | None): Exclusive end of the range; None means up to now.
+
+    Returns:
+        True if every bar in the range is final and can be cached for a day.
+    """
+    if end is None:
+        return False
+
+    end_ts = pd.Timestamp(end)
+    if end_ts.tzinfo is not None:
+        end_ts = end_ts.tz_convert("America/New_York").tz_localize(None)
+
+    today = pd.Timestamp.now(tz="America/New_York").normalize().tz_localize(None)
+    return end_ts <= today
@@ -9,13 +9,14 @@ cleans OHLC data, computes indicators, and assembles chart/insight payloads with
 from datetime import date
 from typing import Any, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from streamlit.delta_generator import DeltaGenerator
 
 from src.models.base import Sector, Ticker
-from src.services.core import (compute_max_profit, compute_sdr, compute_sma,
-                               compute_streak)
+from src.services.core import (compute_last_sdr, compute_max_profit,
+                               compute_smas, compute_streak)
 from src.services.data import clean_data
 from src.services.finance import (IndustryOverview, get_industry_overview,
                                   get_sector_info, get_sectors,
@@ -45,7 +46,7 @@ def make_sector_inputs(column: DeltaGenerator) -> Sector:
 
 def make_price_metrics(
     ticker_info: Ticker, ticker_data: pd.DataFrame
-) -> dict[str, float | str | pd.Series] | None:
+) -> dict[str, float | str] | None:
     """
     Prepares basic price metrics for visualisation.
 
@@ -54,31 +55,33 @@ def make_price_metrics(
         ticker_data (pd.DataFrame): Ticker data
 
     Returns:
-        dict[str, float | str | pd.Series] | None: If no errors from yfinance,
+        dict[str, float | str] | None: If no errors from yfinance,
         will return price metrics, else None.
     """
 
     # data here is assumed to be cleaned before this
     close: pd.Series = ticker_data["Close"]
-    open: pd.Series = ticker_data["Close"]
-    high: pd.Series = ticker_data["Close"]
-    low: pd.Series = ticker_data["Open"]
 
-    # handles NoneType error when interval and horizon match
-    if close.isna().any() and len(close) == 1:
+    # handles NoneType error when interval and horizon match; metrics below
+    # also need a previous close, so fewer than two bars cannot be summarised
+    if len(close) < 2:
         st.error("Whoops, could not fetch data!")
         return None
     else:
-        sdr: pd.Series = compute_sdr(close)
+        # index raw arrays once instead of going through Series.iloc per value
+        close_values: np.ndarray = close.to_numpy()
+        open_values: np.ndarray = ticker_data["Open"].to_numpy()
+        high_values: np.ndarray = ticker_data["High"].to_numpy()
+        low_values: np.ndarray = ticker_data["Low"].to_numpy()
+
         latest_price: float = ticker_info.price
-        latest_return: float = sdr.iloc[-1]
-        previous_close: float = close.iloc[-2]
+        latest_return: float = compute_last_sdr(close)
+        previous_close: float = float(close_values[-2])
         absolute_change: float = latest_price - previous_close
-        latest_open: float = open.iloc[-1]
-        days_range: str = f"{low.iloc[-1]:.2f} - {high.iloc[-1]:.2f}"
+        latest_open: float = float(open_values[-1])
+        days_range: str = f"{low_values[-1]:.2f} - {high_values[-1]:.2f}"
 
-        metrics: dict[str, float | str | pd.Series] = {
-            "sdr": sdr,
+        metrics: dict[str, float | str] = {
             "latest_price": latest_price,
             "latest_return": latest_return,
             "previous_close": previous_close,
@@ -90,28 +93,37 @@ def make_price_metrics(
         return metrics
 
 
-@st.cache_data
 def make_industry_summary_df(industries: list[str]) -> pd.DataFrame:
     """
     Prepares summary data of all industries.
 
+    Note:
+        - Not cached itself: each industry is memoised by `get_industry_info`,
+          while one that failed (and was left out) is retried on the next rerun
+          instead of staying missing for the life of a cached summary.
+
     Args:
         industries (list[str]): Industries to be compiled.
 
     Returns:
-        pd.DataFrame: Industry summary containing weights, percentage changes,
-        and colours (for visualisation).
+        pd.DataFrame: Industry summary containing display names, weights,
+        and percentage changes.
     """
     overview: IndustryOverview = get_industry_overview(industries)
-    df = pd.DataFrame(list(overview))  # realize iterable once
-    df.rename(columns={"industry": "raw_industry"}, inplace=True)
-
-    df.insert(0, "industry", df["raw_industry"].map(format_name))
-    df["color"] = df["pct_change"].apply(lambda x: "green" if float(x) >= 0 else "red")
-
-    subset: pd.DataFrame = df[["industry", "weight", "pct_change", "color"]]
 
-    return subset
+    # single pass over the records, filling each column directly
+    names: list[str] = []
+    weights: list[float] = []
+    pct_changes: list[float] = []
+    for record in overview:
+        names.append(format_name(record["industry"]))
+        weights.append(record["weight"])
+        pct_changes.append(record["pct_change"])
+
+    # treemap colours are derived from the sign of pct_change at plot time
+    return pd.DataFrame(
+        {"industry": names, "weight": weights, "pct_change": pct_changes}
+    )
 
 
 def make_indicator_inputs(
@@ -127,11 +139,22 @@ def make_indicator_inputs(
     Returns:
         dict[int, pd.Series]: Mapping of technical indicators to their computed values.
     """
-    out: dict[int, pd.Series] = {}
+    # all windows share a single prefix-sum pass over `close`; the results are
+    # only plotted, so float32 output is plenty and halves the figure payload
+    return compute_smas(close, indicators, dtype=np.float32)
+
+
+def make_trend_inputs(close: pd.Series) -> tuple[int, int, pd.Series]:
+    """
+    Prepares up/down run inputs for the trend marker chart.
 
-    for n in indicators:
-        out[n] = compute_sma(close, n)
-    return out
+    Args:
+        close (pd.Series): Closing price
+
+    Returns:
+        tuple[int, int, pd.Series]: Longest up streak, down streak, and direction mask.
+    """
+    return compute_streak(close)
 
 
 def clean_ohlc(df: pd.DataFrame) -> pd.DataFrame:
@@ -149,14 +172,19 @@ def clean_ohlc(df: pd.DataFrame) -> pd.DataFrame:
     missing = [c for c in cols if c not in df.columns]
     if missing:
         raise KeyError(f"Missing columns: {missing}")
-    return df[cols].apply(clean_data, axis=0)
+    # clean all columns in one pass rather than once per column
+    return clean_data(df[cols])
 
 
-@st.cache_data
 def make_chart_inputs(filters: dict[str, Any]) -> dict[str, Any] | None:
     """
     Prepares chart inputs for ticker data visualisation. 
 
+    Note:
+        - Not cached itself: `get_ticker_data` reads from memoised downloads and
+          `get_ticker_info` is memoised, and another cache layer on top would
+          add its TTL to theirs.
+
     Args:
         filters (dict[str, Any]): Filter information from UI. 
 
@@ -177,14 +205,10 @@ def make_chart_inputs(filters: dict[str, Any]) -> dict[str, Any] | None:
         cleaned = clean_ohlc(ticker_data)
 
         ticker_info = get_ticker_info(filters["selected_ticker"])
-        up, down, mask = compute_streak(cleaned["Close"])
 
         chart_inputs: dict[str, Any] = {
             "ticker_info": ticker_info,
             "ticker_data": cleaned,
-            "up_streaks": up,
-            "down_streaks": down,
-            "streak_mask": mask,
         }
 
         return chart_inputs
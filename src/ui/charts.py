@@ -4,12 +4,30 @@ charts.py
 Plotly chart builders used by the UI layer.
 """
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 
 
+def to_plot_values(series: pd.Series) -> np.ndarray:
+    """
+    Converts a price series into a compact array for plotting.
+
+    Note:
+        - Plotly ships numeric arrays to the browser as typed binary buffers, so
+          float32 halves the payload versus float64; 7 significant digits are
+          ample for on-screen prices. Computations should keep using float64.
+
+    Args:
+        series (pd.Series): Series to be plotted
+
+    Returns:
+        np.ndarray: float32 values of the series.
+    """
+    return series.to_numpy(dtype=np.float32)
+
+
 def create_figure() -> go.Figure:
     """
     Creates a plotly figure for visualisation of various charts.
@@ -41,17 +59,23 @@ def set_treemap(summary_df: pd.DataFrame) -> go.Figure:
     Returns:
         go.Figure: Treemap figure.
     """
-    fig: go.Figure = px.treemap(
-        summary_df,
-        path=["industry"],  # unique leaves
-        values="weight",
-        color=summary_df["pct_change"] >= 0,  # boolean → True/False
-        color_discrete_map={True: "#2ca02c", False: "#d62728"},
-        custom_data=["pct_change"],
-    )
-    fig.update_traces(
-        texttemplate="%{label}<br>Weight: %{value:.2%}<br>Change: %{customdata[0]:.2f}%",
-        textfont=dict(size=18),
+    # DEV NOTES:
+    # - Built with `go.Treemap` directly; `px.treemap` would re-derive the
+    #   same leaves from the DataFrame on every call.
+    # - All industries are leaves under an implicit root (parent "").
+    names: list[str] = summary_df["industry"].tolist()
+    pct_change: np.ndarray = summary_df["pct_change"].to_numpy(dtype=float)
+
+    fig: go.Figure = go.Figure(
+        go.Treemap(
+            labels=names,
+            parents=[""] * len(names),
+            values=summary_df["weight"].to_numpy(),
+            marker=dict(colors=np.where(pct_change >= 0, "#2ca02c", "#d62728")),
+            customdata=pct_change[:, None],
+            texttemplate="%{label}<br>Weight: %{value:.2%}<br>Change: %{customdata[0]:.2f}%",
+            textfont=dict(size=18),
+        )
     )
 
     fig.update_layout(
@@ -75,7 +99,7 @@ def set_linechart(fig: go.Figure, close: pd.Series) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=close.index,
-            y=close.values,
+            y=to_plot_values(close),
             mode="lines",
             line=dict(color="blue"),
             name="Close Price",
@@ -104,14 +128,15 @@ def set_line_trend_chart(
     # - Marker color encodes direction (green for up/flat, red for down).
     # - Annotation uses paper coordinates (xref/yref="paper") so it stays
     #   pinned relative to the figure area regardless of data zoom/pan.
-    marker_colors = ["green" if m == 1 or m == 0 else "red" for m in mask]
+    # - Colours are picked with one vectorized `np.where` over the mask.
+    marker_colors = np.where(mask.to_numpy() >= 0, "green", "red")
     mode = "lines+markers"
     line_color = "gray"
 
     fig.add_trace(
         go.Scatter(
             x=close.index,
-            y=close.values,
+            y=to_plot_values(close),
             mode=mode,
             line=dict(color=line_color),  # fallback, ignored by marker coloring
             marker=dict(color=marker_colors, size=8),  # color points
@@ -155,10 +180,10 @@ def set_candlechart(fig: go.Figure, ticker_data: pd.DataFrame) -> go.Figure:
     fig.add_trace(
         go.Candlestick(
             x=ticker_data.index,
-            open=ticker_data["Open"],
-            high=ticker_data["High"],
-            low=ticker_data["Low"],
-            close=ticker_data["Close"],
+            open=to_plot_values(ticker_data["Open"]),
+            high=to_plot_values(ticker_data["High"]),
+            low=to_plot_values(ticker_data["Low"]),
+            close=to_plot_values(ticker_data["Close"]),
             name="Price",
         ),
         row=1,
@@ -167,17 +192,17 @@ def set_candlechart(fig: go.Figure, ticker_data: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def set_indicators(fig: go.Figure, close: pd.Series, n: int) -> go.Figure:
+def set_indicators(fig: go.Figure, indicators: dict[int, pd.Series]) -> go.Figure:
     """
-    Sets a technical indicator trace onto a figure.
+    Sets technical indicator traces onto a figure.
 
     Note:
         - We assume SMA to be the only technical incators as of now.
 
     Args:
         fig (go.Figure): Target figure
-        close (pd.Series): Closing price
-        n (int): SMA period (e.g. 5, 20, 50)
+        indicators (dict[int, pd.Series]): Mapping of SMA period (e.g. 5, 20, 50)
+            to its computed values
 
     Returns:
         go.Figure: Figure with computed technical indicators plotted.
@@ -185,10 +210,22 @@ def set_indicators(fig: go.Figure, close: pd.Series, n: int) -> go.Figure:
     # DEV NOTES:
     # - Keep line thin so it layers well over candles.
     # - Name uses f"SMA {n}" for concise legends.
-    fig.add_trace(
-        go.Scatter(
-            x=close.index, y=close, mode="lines", line=dict(width=1.5), name=f"SMA {n}"
-        )
+    # - Traces are added in one `add_traces` call so the figure is validated
+    #   once, while each SMA keeps its own colour and legend entry.
+    if not indicators:
+        return fig
+
+    fig.add_traces(
+        [
+            go.Scatter(
+                x=sma.index,
+                y=to_plot_values(sma),
+                mode="lines",
+                line=dict(width=1.5),
+                name=f"SMA {n}",
+            )
+            for n, sma in indicators.items()
+        ]
     )
 
     return fig
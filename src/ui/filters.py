@@ -8,18 +8,21 @@ from typing import Any
 
 from streamlit.delta_generator import DeltaGenerator
 
+from src.constants.filters import (DAILY_INTERVALS, HORIZON_KEYS,
+                                   HORIZON_MAPPING, INDICATOR_KEYS,
+                                   INDICATOR_MAPPING, INTRADAY_INTERVALS,
+                                   MONTHLY_INTERVALS, MULTIDAY_INTERVALS)
+from src.models.base import Sector
 from src.utils.helpers import rolling_window
 
 
-def display_filters(
-    column: DeltaGenerator, sector_data: dict[str, Any]
-) -> dict[str, Any]:
+def display_filters(column: DeltaGenerator, sector_data: Sector) -> dict[str, Any]:
     """
     Build and return UI filter selections for finance charts.
 
     Args:
         column (DeltaGenerator): Column for streamlit elements to be stationed.
-        sector_data dict[str, Any]: Data used to populate controls 
+        sector_data (Sector): Data used to populate controls
 
     Returns:
         dict[str, Any]: Filter selections for chart generation.
@@ -27,58 +30,48 @@ def display_filters(
     # Ticker selector
     selected_ticker = column.selectbox(
         "Select a ticker",
-        sector_data["top_companies"],
+        sector_data.top_companies,
         help="Choose the stock or asset you want to view.",
     )
 
-    # Time horizon presets → arguments for rolling_window()
-    horizon_mapping = {
-        "1 Day": {"n": 1, "unit": "days"},  # interval = 1m
-        "5 Day": {"n": 5, "unit": "days"},
-        "1 Month": {"n": 1, "unit": "months"},
-        "6 Month": {"n": 6, "unit": "months"},
-        "1 Year": {"n": 1, "unit": "years"},
-        "3 Year": {"n": 3, "unit": "years"},
-        "5 Year": {"n": 5, "unit": "years"},
-    }
-
     selected_key = column.pills(
         "Time Horizon",
-        options=list(horizon_mapping.keys()),
+        options=HORIZON_KEYS,
         default="1 Year",
         help="Select how far back the data should be shown.",
     )
 
-    selected_horizon = horizon_mapping[selected_key]
+    selected_horizon = HORIZON_MAPPING[selected_key]
     # Data interval choices depend on horizon.
-    # DEV NOTE: The second `elif` below is unreachable because the first `if`
-    # already captures unit == "days". Preserving logic as-is (no behavior change).
-    # Consider refactoring to a clear decision table.
-    if selected_horizon["unit"] == "days":
-        data_intervals = ["1m", "2m", "5m", "15m", "30m", "1h"]
-    elif selected_horizon["unit"] == "days" and selected_horizon["n"] == 5:
-        data_intervals = ["1m", "2m", "5m", "15m", "30m", "1h", "1d"]
+    # Multi-day intraday views default to 5m bars: 1m would request ~5x the
+    # rows for no visible benefit at that zoom level.
+    if selected_horizon["unit"] == "days" and selected_horizon["n"] == 1:
+        data_intervals = INTRADAY_INTERVALS
+        default_interval = "1m"
+    elif selected_horizon["unit"] == "days":
+        data_intervals = MULTIDAY_INTERVALS
+        default_interval = "5m"
     elif selected_horizon["unit"] == "months" and selected_horizon["n"] == 1:
-        data_intervals = ["1d", "5d", "1wk", "1mo"]
+        data_intervals = MONTHLY_INTERVALS
+        default_interval = "1d"
     else:
-        data_intervals = ["1d", "5d", "1wk", "1mo", "3mo"]
+        data_intervals = DAILY_INTERVALS
+        default_interval = "1d"
 
     selected_interval = column.pills(
         "Data Interval",
         data_intervals,
-        default=data_intervals[0],
+        default=default_interval,
         help="Select how often data points are sampled (e.g. daily, weekly, or hourly).",
     )
-    # Technical indicator presets (e.g., SMA)
-    indicator_mapping = {"SMA 5": 5, "SMA 20": 20, "SMA 50": 50}
-
+    # Technical indicator selection (e.g., SMA)
     tech_indicators = column.multiselect(
         "Technical Indicators",
-        options=list(indicator_mapping.keys()),
+        options=INDICATOR_KEYS,
         default=[],
         help="Apply indicators that reveal trends, momentum, and market strength.",
     )
-    selected_indicators = [indicator_mapping[ind] for ind in tech_indicators]
+    selected_indicators = [INDICATOR_MAPPING[ind] for ind in tech_indicators]
     # Chart type selection
     selected_chart_type = column.radio(
         "Select a chart",
@@ -11,13 +11,15 @@ Notes
 from typing import Any
 
 import pandas as pd
+import plotly.graph_objs as go
 import streamlit as st
 from streamlit.delta_generator import DeltaGenerator
 
 from src.models.base import Sector, Ticker
 from src.ui.adapters import (make_chart_inputs, make_indicator_inputs,
                              make_industry_summary_df, make_insight_input,
-                             make_price_metrics, make_sector_inputs)
+                             make_price_metrics, make_sector_inputs,
+                             make_trend_inputs)
 from src.ui.charts import (create_figure, set_candlechart, set_indicators,
                            set_line_trend_chart, set_linechart, set_treemap)
 from src.utils.helpers import format_large_number, timer
@@ -64,7 +66,7 @@ def display_industry_overview(column: DeltaGenerator, industries: list[str]) ->
         industries (list[str]): List of industries
     """
     # DEV NOTE:
-    # - Creates a DataFrame for Plotly treemap; color column derived from pct_change sign.
+    # - Creates a DataFrame for Plotly treemap; colours derived from pct_change sign.
     column.subheader(
         "Sector Breakdown", help="A sector is comprised of multiplie industries."
     )
@@ -79,8 +81,8 @@ def display_industry_overview(column: DeltaGenerator, industries: list[str]) ->
     column.plotly_chart(fig, use_container_width=True)
 
 
-@timer
 @st.cache_data
+@timer
 def display_basic_price_info(ticker_info: Ticker, ticker_data: pd.DataFrame):
     """
     Render top-level price metrics for the current ticker.
@@ -90,6 +92,10 @@ def display_basic_price_info(ticker_info: Ticker, ticker_data: pd.DataFrame):
         ticker_data (pd.DataFrame): OHLCV data with columns: Open, High, Low, Close (indexed by datetime).
     """
     metrics = make_price_metrics(ticker_info, ticker_data)
+
+    if metrics is None:
+        return
+
     st.metric(
         "Price",
         f"{metrics['latest_price']:.2f} USD",
@@ -101,6 +107,53 @@ def display_basic_price_info(ticker_info: Ticker, ticker_data: pd.DataFrame):
     st.metric("Day's Range", metrics["days_range"], border=False)
 
 
+@timer
+def build_price_figure(
+    filters: dict[str, Any], ticker_data: pd.DataFrame
+) -> go.Figure:
+    """
+    Build the price figure (chart type plus indicator overlays) for a ticker.
+
+    Note:
+        - Not cached: a pickled `go.Figure` re-runs its constructor and
+          validation when loaded, and `plotly_chart` re-validates a figure
+          passed as a dict, so a cache hit costs about as much as a rebuild.
+
+    Args:
+        filters (dict[str, Any]): Filter selection to be used for plotting.
+        ticker_data (pd.DataFrame): Cleaned OHLC data for the selected ticker.
+
+    Returns:
+        go.Figure: Plot-ready price figure.
+    """
+    # DEV NOTE:
+    # - Keeps branching for chart types; indicators are added afterward.
+    close = ticker_data["Close"]
+    fig = create_figure()
+
+    if filters["selected_chart_type"] == "Line Chart":
+        fig = set_linechart(fig, close)
+    elif filters["selected_chart_type"] == "Line Chart and Trend Markers":
+        # streaks are only needed here, so other chart types skip the scan
+        up_streaks, down_streaks, streak_mask = make_trend_inputs(close)
+        fig = set_line_trend_chart(fig, close, up_streaks, down_streaks, streak_mask)
+    else:
+        fig = set_candlechart(fig, ticker_data)
+
+    # this adds technical indicator overlaid onto existing charts
+    indicator_inputs = make_indicator_inputs(close, filters["selected_indicators"])
+
+    fig = set_indicators(fig, indicator_inputs)
+
+    fig.update_layout(
+        xaxis=dict(type="date", tickformat="%b %d, %Y"),
+        yaxis=dict(title="Price"),
+        margin=dict(l=0, r=0, t=0, b=0),
+    )
+
+    return fig
+
+
 @timer
 def display_charts(column: DeltaGenerator, filters: dict[str, Any]) -> None:
     """
@@ -112,17 +165,15 @@ def display_charts(column: DeltaGenerator, filters: dict[str, Any]) -> None:
     """
     inputs = make_chart_inputs(filters)
 
-    if inputs is None:
+    # at least two bars are needed for returns, changes, and charts below
+    if inputs is None or len(inputs["ticker_data"]) < 2:
         column.error(
             f"Whoops, seems like data for {filters['selected_ticker']} could not be retrieved."
         )
-        st.stop()
+        return
 
     ticker_info = inputs["ticker_info"]
     ticker_data = inputs["ticker_data"]
-    up_streaks = inputs["up_streaks"]
-    down_streaks = inputs["down_streaks"]
-    streak_mask = inputs["streak_mask"]
     close = ticker_data["Close"]
 
     display_name = f"{ticker_info.long_name} ({ticker_info.symbol})"
@@ -133,44 +184,17 @@ def display_charts(column: DeltaGenerator, filters: dict[str, Any]) -> None:
     with row:
         display_basic_price_info(ticker_info, ticker_data)
 
-    # DEV NOTE:
-    # - Keeps branching for chart types; indicators are added afterward.
-    if ticker_data is None:
-        column.error("No price data was found. Try again.")
-    else:
-        fig = create_figure()
-
-        if filters["selected_chart_type"] == "Line Chart":
-            fig = set_linechart(fig, close)
-        elif filters["selected_chart_type"] == "Line Chart and Trend Markers":
-            fig = set_line_trend_chart(
-                fig, close, up_streaks, down_streaks, streak_mask
-            )
-        else:
-            fig = set_candlechart(fig, ticker_data)
-
-        # this adds technical indicator overlaid onto existing charts
-        indicator_inputs = make_indicator_inputs(close, filters["selected_indicators"])
-
-        for key, value in indicator_inputs.items():
-            fig = set_indicators(fig, value, key)
-
-        fig.update_layout(
-            xaxis=dict(type="date", tickformat="%b %d, %Y"),
-            yaxis=dict(title="Price"),
-            margin=dict(l=0, r=0, t=0, b=0),
-        )
-
-        column.plotly_chart(fig, use_container_width=True)
+    fig = build_price_figure(filters, ticker_data)
+    column.plotly_chart(fig, use_container_width=True)
 
-        # SUMMARY TEXT (dev note):
-        # - Uses greedy max-profit metric as a quick “best sequence” indicator.
-        max_profit, start_date, end_date = make_insight_input(
-            close, filters["selected_horizon"]
-        )
-        column.markdown(
-            f"**Your best trading sequence from :red[{start_date}] to :red[{end_date}], you could have earned :green[${max_profit:.2f}] in total profit.**"
-        )
+    # SUMMARY TEXT (dev note):
+    # - Uses greedy max-profit metric as a quick “best sequence” indicator.
+    max_profit, start_date, end_date = make_insight_input(
+        close, filters["selected_horizon"]
+    )
+    column.markdown(
+        f"**Your best trading sequence from :red[{start_date}] to :red[{end_date}], you could have earned :green[${max_profit:.2f}] in total profit.**"
+    )
 
-        with column.expander(f"{display_name} Overview"):
-            st.write(ticker_info.description)
+    with column.expander(f"{display_name} Overview"):
+        st.write(ticker_info.description)
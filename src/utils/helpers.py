@@ -10,9 +10,10 @@ as the application evolves.
 """
 
 import logging
+import os
 from datetime import date
-from functools import wraps
-from time import perf_counter
+from functools import lru_cache, wraps
+from time import perf_counter_ns
 from typing import Callable, ParamSpec, TypeVar
 
 import pandas as pd
@@ -27,6 +28,7 @@ def format_date(date: date) -> str:
     return date.strftime("%b %d, %Y")  # e.g. Oct 08, 2025
 
 
+@lru_cache(maxsize=512)
 def format_name(name: str) -> str:
     """Formats name of sector/industry to be usable by API"""
     # replace dashes
@@ -36,6 +38,7 @@ def format_name(name: str) -> str:
     return name.title()
 
 
+@lru_cache(maxsize=256)
 def format_large_number(n: int | float) -> str:
     """
     Convert a large numeric value into a human-readable string with suffixes.
@@ -100,21 +103,32 @@ def timer(func: Callable[P, R]) -> Callable[P, R]:
     """
     Measures wall clock-time of two points.
 
+    Timing is opt-in: unless the ``STALK_TIMING`` environment variable is set
+    when the module is imported, the decorator returns `func` unchanged so
+    decorated functions carry no per-call overhead. When enabled, calls are
+    only timed while the root logger emits INFO records.
+
     Args:
         func (Callable): Function to be timed.
 
     Returns:
-        A wrapped function that behaves like `func` but prints the time
-        it took to execute.
+        `func` itself when timing is disabled, otherwise a wrapped function
+        that behaves like `func` but logs the time it took to execute.
     """
+    if not os.environ.get("STALK_TIMING"):
+        return func
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         """Wrapper function that times the execution of `func`."""
-        start = perf_counter()
+        # skip the clock reads entirely when the record would be dropped
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+
+        start = perf_counter_ns()
         output = func(*args, **kwargs)
-        end = perf_counter()
-        logging.info(f"{func.__name__} executed in {(end - start):.6f} seconds")
+        elapsed = perf_counter_ns() - start
+        logging.info("%s executed in %.6f seconds", func.__name__, elapsed / 1e9)
         return output
 
     return wrapper
@@ -0,0 +1,82 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.models.base import Industry
+from src.services.cache import DiskCache
+from src.services.finance import is_closed_range
+
+
+def test_disk_cache_roundtrip(tmp_path) -> None:
+    cache = DiskCache(tmp_path)
+    key = ("download", "AAPL", [("interval", "1d")])
+    data = pd.DataFrame(
+        {"Close": np.array([1.0, 2.0], dtype=np.float32)},
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"], tz="America/New_York"),
+    )
+
+    assert cache.get(key) is None
+    cache.set(key, data)
+    pd.testing.assert_frame_equal(cache.get(key), data, check_freq=False)
+    assert not list(tmp_path.glob("*.tmp"))  # temporary file was renamed
+
+
+def test_disk_cache_ttl(tmp_path) -> None:
+    cache = DiskCache(tmp_path)
+    key = ("download", "AAPL")
+    cache.set(key, pd.DataFrame({"Close": [1.0]}))
+
+    # age the entry by an hour
+    stale = cache.path(key).stat().st_mtime - 3600
+    os.utime(cache.path(key), (stale, stale))
+
+    assert cache.get(key, ttl=300) is None
+    assert cache.get(key) is not None
+
+
+def test_disk_cache_miss_is_silent(tmp_path, caplog) -> None:
+    cache = DiskCache(tmp_path)
+
+    with caplog.at_level(logging.WARNING):
+        assert cache.get(("download", "AAPL")) is None
+        assert cache.get_model(("industry", "semiconductors"), Industry) is None
+
+    assert not caplog.records
+
+
+def test_disk_cache_prune(tmp_path) -> None:
+    cache = DiskCache(tmp_path, max_age=3600)
+    old, new = ("download", "AAPL"), ("download", "MSFT")
+    cache.set(old, pd.DataFrame({"Close": [1.0]}))
+
+    stale = cache.path(old).stat().st_mtime - 7200
+    os.utime(cache.path(old), (stale, stale))
+    cache.set(new, pd.DataFrame({"Close": [2.0]}))  # writes trigger a prune
+
+    assert not cache.path(old).exists()
+    assert cache.path(new).exists()
+
+
+def test_is_closed_range() -> None:
+    assert is_closed_range("2020-01-01")
+    assert not is_closed_range(None)
+    assert not is_closed_range(pd.Timestamp.now() + pd.Timedelta(days=2))
+
+
+def test_disk_cache_models(tmp_path) -> None:
+    cache = DiskCache(tmp_path)
+    key = ("industry", "semiconductors")
+    industry = Industry(
+        description=None,
+        employee_count=10,
+        market_cap=1_000,
+        market_weight=0.25,
+        pct_change=-0.01,
+    )
+
+    assert cache.get_model(key, Industry) is None
+    cache.set_model(key, industry)
+    assert cache.get_model(key, Industry) == industry
+    assert cache.get(key) is None  # frames and models do not collide
@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 
-from src.services.core import (compute_max_profit, compute_sdr, compute_sma,
-                               compute_streak)
+from src.services.core import (compute_last_sdr, compute_max_profit,
+                               compute_sdr, compute_sma, compute_smas,
+                               compute_streak, downsample_lttb)
 
 
 def test_compute_sma(sample_close: pd.Series) -> None:
@@ -27,6 +29,15 @@ def test_compute_sma(sample_close: pd.Series) -> None:
     )  # ensure rolling operation produces correct number of nans
 
 
+def test_compute_smas(sample_close: pd.Series) -> None:
+    smas: dict[int, pd.Series] = compute_smas(sample_close, (5, 20, 50))
+    assert list(smas) == [5, 20, 50]
+
+    # shared prefix sums must match the single-window computation
+    for window, sma in smas.items():
+        assert sma.equals(compute_sma(sample_close, window=window))
+
+
 def test_compute_streak(sample_close: pd.Series) -> None:
     up_streak, down_streak, mask = compute_streak(sample_close)
     
@@ -52,7 +63,54 @@ def test_compute_sdr(sample_close: pd.Series) -> None:
     )  # ensure rolling operation produces correct number of nans
 
 
+def test_compute_last_sdr(sample_close: pd.Series) -> None:
+    last: float = compute_last_sdr(sample_close)
+    assert last == compute_sdr(sample_close).iloc[-1]  # matches full series
+    assert pd.isna(compute_last_sdr(sample_close.iloc[:1]))  # single price
+
+
 def test_compute_max_profit(sample_close: pd.Series) -> None:
     profit: float = compute_max_profit(sample_close)
     assert isinstance(profit, float)
     assert profit == 99.0
+
+
+def test_compute_sma_values(sample_close: pd.Series) -> None:
+    sma_5: pd.Series = compute_sma(sample_close, window=5)
+    assert sma_5.iloc[4] == 3.0  # mean of 1..5
+    assert sma_5.iloc[-1] == 98.0  # mean of 96..100
+
+    # window larger than the series yields no defined values
+    assert compute_sma(sample_close, window=200).isna().all()
+
+
+def test_compute_streak_mixed() -> None:
+    close = pd.Series([1.0, 2.0, 3.0, 3.0, 2.0, 1.0, 0.5, 1.0])
+    up_streak, down_streak, mask = compute_streak(close)
+
+    assert up_streak == 2  # 1 -> 2 -> 3
+    assert down_streak == 3  # 3 -> 2 -> 1 -> 0.5
+    assert mask.tolist() == [0, 1, 1, 0, -1, -1, -1, 1]
+    assert compute_max_profit(close) == 2.5
+
+
+def test_downsample_lttb() -> None:
+    close = pd.Series(np.sin(np.linspace(0, 20, 10_000)))
+    sampled: pd.Series = downsample_lttb(close, threshold=500)
+
+    assert len(sampled) == 500
+    assert sampled.index[0] == 0 and sampled.index[-1] == 9_999  # endpoints kept
+    assert sampled.index.is_monotonic_increasing
+    assert sampled.max() > 0.99 and sampled.min() < -0.99  # peaks survive
+
+    # short series are left untouched
+    assert downsample_lttb(close.iloc[:100], threshold=500).equals(close.iloc[:100])
+
+
+def test_compute_float32_outputs(sample_close: pd.Series) -> None:
+    sma: pd.Series = compute_sma(sample_close, window=5, dtype=np.float32)
+    sdr: pd.Series = compute_sdr(sample_close, dtype=np.float32)
+
+    assert sma.dtype == np.float32 and sdr.dtype == np.float32
+    assert np.allclose(sma, compute_sma(sample_close, window=5), equal_nan=True)
+    assert np.allclose(sdr, compute_sdr(sample_close), equal_nan=True)
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src.services.data import clean_data, clean_outliers_iqr, has_missing
+
+
+def test_clean_data_frame() -> None:
+    index = pd.date_range("2024-01-01", periods=14, freq="D")  # starts on a Monday
+    frame = pd.DataFrame(
+        {"Open": np.arange(14.0), "Close": np.arange(14.0) + 1}, index=index
+    )
+    frame.iloc[[0, 3], 1] = np.nan
+
+    cleaned: pd.DataFrame = clean_data(frame)
+
+    assert has_missing(frame) and not has_missing(cleaned)
+    assert len(cleaned) == 10  # weekends dropped for every column at once
+    assert (cleaned.index.dayofweek < 5).all()
+    pd.testing.assert_frame_equal(cleaned, frame.apply(clean_data, axis=0))
+
+
+def test_clean_outliers_iqr() -> None:
+    series = pd.Series([1.0, 2.0, 3.0, 4.0, 100.0])
+
+    masked: pd.Series = clean_outliers_iqr(series, k=1.5)
+    clipped: pd.Series = clean_outliers_iqr(series, replace_with_nan=False, k=1.5)
+
+    assert masked.isna().tolist() == [False, False, False, False, True]
+    assert clipped.iloc[-1] == 4.0 + 1.5 * 2.0  # Q3 + k * IQR
+
+
+def test_has_missing() -> None:
+    assert not has_missing(pd.Series([1.0, 2.0], dtype=np.float32))
+    assert has_missing(pd.Series([1.0, np.nan]))
+    assert has_missing(pd.Series(["a", None]))
+    assert has_missing(pd.DataFrame({"a": [1, 2], "b": [np.nan, 1.0]}))
+    assert not has_missing(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
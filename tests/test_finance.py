@@ -1,9 +1,22 @@
+import datetime
+
 import pandas as pd
 import pytest
 
 from src.models.base import Industry, Sector, Ticker
+from src.services import finance
+from src.services.cache import DiskCache
 from src.services.finance import (get_industry_info, get_sector_info,
-                                  get_ticker_data, get_ticker_info)
+                                  get_ticker_data, get_ticker_info,
+                                  slice_date_range)
+from src.ui.adapters import make_industry_summary_df
+from src.utils.helpers import format_name, rolling_window
+
+
+@pytest.fixture(autouse=True)
+def isolated_disk_cache(tmp_path, monkeypatch):
+    # keep tests off the user's cache and make every lookup reach yfinance
+    monkeypatch.setattr(finance, "disk_cache", DiskCache(tmp_path))
 
 
 def test_get_ticker_info():
@@ -41,3 +54,101 @@ def test_get_sector_info(sectors):
 def test_get_industry_info(industry_key):
     industry = get_industry_info(industry_key=industry_key)
     assert isinstance(industry, Industry)
+
+
+def test_get_ticker_data_daily_window():
+    start, end = rolling_window(6, unit="months")
+    data = get_ticker_data(
+        "AAPL", interval="1d", start=start, end=end, progress=False, auto_adjust=True
+    )
+    assert isinstance(data, pd.DataFrame)
+    # daily requests are sliced from shared history; bounds must still hold
+    assert data.index[0] >= pd.Timestamp(start)
+    assert data.index[-1] < pd.Timestamp(end)
+
+
+def test_industry_summary_retries_failed_lookups(monkeypatch):
+    calls: list[str] = []
+
+    def flaky_industry_info(industry_key: str) -> Industry:
+        calls.append(industry_key)
+        if industry_key == "semiconductors" and calls.count(industry_key) == 1:
+            raise RuntimeError("rate limited")
+        return Industry(
+            description=None,
+            employee_count=1,
+            market_cap=1,
+            market_weight=0.5,
+            pct_change=0.01,
+        )
+
+    monkeypatch.setattr(finance, "get_industry_info", flaky_industry_info)
+    industries = ["semiconductors", "software-application"]
+
+    first = make_industry_summary_df(industries)
+    assert list(first["industry"]) == [format_name("software-application")]
+
+    second = make_industry_summary_df(industries)
+    assert list(second["industry"]) == [format_name(ind) for ind in industries]
+    assert calls.count("semiconductors") == 2
+
+
+@pytest.fixture
+def daily_history() -> pd.DataFrame:
+    index = pd.date_range("2024-01-02", periods=10, tz="America/New_York")
+    return pd.DataFrame({"Close": range(10)}, index=index, dtype=float)
+
+
+def test_slice_date_range(daily_history):
+    # tz-naive bounds against a tz-aware index; end is exclusive
+    sliced = slice_date_range(
+        daily_history, pd.Timestamp("2024-01-04"), datetime.date(2024, 1, 7)
+    )
+    assert list(sliced["Close"]) == [2.0, 3.0, 4.0]
+
+    # no end keeps everything from start onward
+    sliced = slice_date_range(daily_history, pd.Timestamp("2024-01-10"))
+    assert list(sliced["Close"]) == [8.0, 9.0]
+
+    # an empty selection is reported as missing data
+    assert slice_date_range(daily_history, pd.Timestamp("2025-01-01")) is None
+
+
+def test_get_ticker_data_history_coverage(daily_history, monkeypatch):
+    downloads: list[dict] = []
+
+    def fake_download(ticker_symbols, **kwargs):
+        downloads.append(kwargs)
+        return daily_history
+
+    monkeypatch.setattr(finance, "get_daily_history", lambda *_, **__: daily_history)
+    monkeypatch.setattr(finance, "download_ticker_data", fake_download)
+    finance.get_ticker_download.clear()
+
+    # covered by the history: sliced without downloading
+    data = get_ticker_data("TEST", interval="1d", start="2024-01-05", end="2024-01-08")
+    assert list(data["Close"]) == [3.0, 4.0, 5.0]
+
+    # starts before a young ticker's first bar: the history still has it all
+    data = get_ticker_data("TEST", interval="1d", start="2023-06-01", end="2024-01-04")
+    assert list(data["Close"]) == [0.0, 1.0]
+    assert not downloads
+
+    # starts before the history window: falls back to a direct download
+    get_ticker_data("TEST", interval="1d", start="2000-01-03", end="2024-01-08")
+    assert downloads == [{"interval": "1d", "start": "2000-01-03", "end": "2024-01-08"}]
+
+
+def test_download_ticker_data_caches_empty_result(monkeypatch):
+    calls: list[str] = []
+
+    def empty_download(tickers, **kwargs):
+        calls.append(tickers)
+        return pd.DataFrame()
+
+    monkeypatch.setattr(finance.yf, "download", empty_download)
+
+    # e.g. today's bar before the open: a miss, but not downloaded again
+    assert finance.download_ticker_data("TEST", interval="1d") is None
+    assert finance.download_ticker_data("TEST", interval="1d") is None
+    assert calls == ["TEST"]
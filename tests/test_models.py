@@ -1,7 +1,10 @@
+import numpy as np
+import pandas as pd
 import pytest
 from pydantic import ValidationError
 
 from src.models.base import Ticker
+from src.models.dataframe import SingleStockData, validate_once
 
 
 @pytest.mark.parametrize(
@@ -47,3 +50,37 @@ def test_valid_ticker():
                 "volume": 148071154,
             }
         )
+
+
+def test_ticker_is_frozen():
+    ticker = Ticker(
+        symbol="NVDA",
+        display_name=None,
+        long_name=None,
+        short_name=None,
+        market_cap=None,
+        price=178.19,
+        sector=None,
+        industry=None,
+        description=None,
+        dividend_rate=None,
+        dividend_yield=None,
+        volume=None,
+    )
+    with pytest.raises(ValidationError):
+        ticker.price = 0.0
+    assert hash(ticker) == hash(ticker.model_copy())
+
+
+def test_validate_once(monkeypatch):
+    frame = pd.DataFrame(
+        {"Close": [1.0], "High": [1.0], "Low": [1.0], "Open": [1.0], "Volume": [10]}
+    )
+
+    monkeypatch.setenv("STALK_SKIP_VALIDATION", "1")
+    assert validate_once(frame, SingleStockData) is frame
+    assert frame["Close"].dtype == np.float64
+
+    monkeypatch.delenv("STALK_SKIP_VALIDATION")
+    validated = validate_once(frame.astype({"Close": np.float32}), SingleStockData)
+    assert validated["Close"].dtype == np.float64